@@ -31,6 +31,12 @@ OBJECT_PATH = "/com/claude/FocusService"
 SESSION_DATA_FILE = os.path.expanduser("~/.claude/session-data.json")
 LOG_FILE = "/tmp/claude-focus-service.log"
 
+# Process names recognized as terminal emulators when walking the tree;
+# frozenset gives O(1) membership and signals the set is immutable
+TERMINAL_COMMS = frozenset({
+    'gnome-terminal-', 'gnome-terminal', 'terminator', 'xterm', 'konsole'
+})
+
 # Set up logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -47,6 +53,8 @@ class SessionManager:
 
     def __init__(self):
         self.sessions: Dict[str, Dict] = {}
+        # Create the data directory once up front instead of on every save
+        os.makedirs(os.path.dirname(SESSION_DATA_FILE), exist_ok=True)
         self.load_sessions()
 
     def load_sessions(self):
@@ -65,20 +73,20 @@ class SessionManager:
     def save_sessions(self):
         """Save session data to disk"""
         try:
-            os.makedirs(os.path.dirname(SESSION_DATA_FILE), exist_ok=True)
             with open(SESSION_DATA_FILE, 'w') as f:
-                json.dump(self.sessions, f, indent=2)
+                json.dump(self.sessions, f, separators=(',', ':'))
             logger.debug("Session data saved to disk")
         except Exception as e:
             logger.error(f"Failed to save session data: {e}")
 
     def register_session(self, session_id: str, cwd: str, terminal_screen: str):
         """Register a Claude session with its context"""
+        now = time.time()
         self.sessions[session_id] = {
             'cwd': cwd,
             'terminal_screen': terminal_screen,
-            'registered_at': time.time(),
-            'last_activity': time.time()
+            'registered_at': now,
+            'last_activity': now
         }
         self.save_sessions()
         logger.info(f"Registered session {session_id[:8]}... in {cwd} with terminal {terminal_screen[:16] if terminal_screen else 'unknown'}...")
@@ -157,7 +165,7 @@ class TerminalFinder:
                     logger.debug(f"Process tree: {current_pid} -> {parent_pid} ({comm})")
 
                     # Check if this is a terminal process
-                    if comm in ['gnome-terminal-', 'gnome-terminal', 'terminator', 'xterm', 'konsole']:
+                    if comm in TERMINAL_COMMS:
                         # Found terminal, now find its window ID
                         window_id = TerminalFinder.find_window_by_pid(parent_pid)
                         if window_id:
@@ -203,10 +211,12 @@ class TerminalFinder:
     def focus_window(window_id: str) -> bool:
         """Focus a window by its ID"""
         try:
-            # Try wmctrl first
+            # Try wmctrl first. Output is unused - only the return code
+            # matters - so skip the pipe setup and capture entirely
             result = subprocess.run(
                 ['wmctrl', '-ia', window_id],
-                capture_output=True, text=True
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                check=False
             )
 
             if result.returncode == 0:
@@ -220,7 +230,8 @@ class TerminalFinder:
             # Fallback to xdotool
             result = subprocess.run(
                 ['xdotool', 'windowactivate', window_id],
-                capture_output=True, text=True
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                check=False
             )
 
             if result.returncode == 0:
@@ -471,7 +482,7 @@ class ClaudeFocusService(dbus.service.Object):
 
             # Save updated active notifications
             with open(active_file, 'w') as f:
-                json.dump(active, f, indent=2)
+                json.dump(active, f, separators=(',', ':'))
 
             logger.info(f"Successfully dismissed notification {notification_id}")
             return True
@@ -12,12 +12,17 @@ from typing import Dict, List, Optional
 def get_process_info(pid: int) -> Optional[Dict]:
     """Get process information including environment"""
     try:
-        with open(f'/proc/{pid}/stat', 'r') as f:
-            stat_data = f.read().split()
-            ppid = int(stat_data[3]) if len(stat_data) > 3 else 0
-
-        with open(f'/proc/{pid}/comm', 'r') as f:
-            comm = f.read().strip()
+        # A single status read yields both the process name and its parent
+        # pid - previously this took separate stat and comm reads
+        comm = ''
+        ppid = 0
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('Name:'):
+                    comm = line[5:].strip()
+                elif line.startswith('PPid:'):
+                    ppid = int(line[5:])
+                    break  # PPid comes after Name, nothing further needed
 
         # Get environment variables
         env_vars = {}
@@ -14,7 +14,6 @@ import os
 import sys
 import time
 import logging
-import subprocess
 import dbus
 import dbus.service
 from dbus.mainloop.glib import DBusGMainLoop
@@ -28,6 +27,10 @@ OBJECT_PATH = "/com/claude/FocusService"
 MAX_SESSION_AGE = 24 * 60 * 60  # 24 hours
 CLEANUP_INTERVAL = 60 * 60  # 1 hour
 
+# Error notification actions/hints never vary - build them once
+ERROR_ACTIONS = ["dismiss", "Dismiss"]
+ERROR_HINTS = {"urgency": dbus.Byte(2)}
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -37,7 +40,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Information about a Claude session"""
     session_id: str
@@ -133,6 +136,17 @@ class ClaudeFocusService(dbus.service.Object):
         # Initialize session registry
         self.registry = SessionRegistry()
 
+        # Reusable proxy for org.freedesktop.Notifications - the service
+        # already holds a bus connection, so never open another one
+        notify_service = self.bus.get_object(
+            "org.freedesktop.Notifications",
+            "/org/freedesktop/Notifications"
+        )
+        self.notify_interface = dbus.Interface(
+            notify_service,
+            "org.freedesktop.Notifications"
+        )
+
         # Set up notification listener
         self.setup_notification_listener()
 
@@ -179,16 +193,21 @@ class ClaudeFocusService(dbus.service.Object):
     def focus_terminal_for_session(self, session: SessionInfo) -> bool:
         """Focus the terminal window for a specific session"""
         try:
-            # Get list of windows using Window Calls extension
-            result = subprocess.run([
-                'gdbus', 'call', '--session',
-                '--dest=org.gnome.Shell',
-                '--object-path=/org/gnome/Shell/Extensions/Windows',
-                '--method=org.gnome.Shell.Extensions.Windows.List'
-            ], capture_output=True, text=True, timeout=5)
-
-            if result.returncode != 0:
-                logger.error("Window Calls extension not available")
+            # Get list of windows using Window Calls extension, called
+            # in-process over the service's existing bus connection: the
+            # List method returns the JSON payload directly, so no gdbus
+            # fork and no parsing of GVariant text output
+            try:
+                shell = self.bus.get_object(
+                    'org.gnome.Shell',
+                    '/org/gnome/Shell/Extensions/Windows'
+                )
+                windows_iface = dbus.Interface(
+                    shell, 'org.gnome.Shell.Extensions.Windows'
+                )
+                windows = json.loads(str(windows_iface.List()))
+            except dbus.exceptions.DBusException as e:
+                logger.error(f"Window Calls extension not available: {e}")
                 self.send_error_notification(
                     "Focus Failed",
                     "Window Calls GNOME extension is required but not available.\n"
@@ -196,16 +215,6 @@ class ClaudeFocusService(dbus.service.Object):
                 )
                 return False
 
-            # Parse window list
-            import json
-            windows_data = result.stdout.strip()
-            if not (windows_data.startswith("('[") and windows_data.endswith("',)")):
-                logger.error(f"Unexpected Window Calls output: {windows_data[:100]}")
-                return False
-
-            json_str = windows_data[2:-3]
-            windows = json.loads(json_str)
-
             # Find terminal windows
             terminal_windows = [
                 w for w in windows
@@ -248,21 +257,15 @@ class ClaudeFocusService(dbus.service.Object):
 
             # Focus the terminal window
             window_id = target_window['id']
-            activate_result = subprocess.run([
-                'gdbus', 'call', '--session',
-                '--dest=org.gnome.Shell',
-                '--object-path=/org/gnome/Shell/Extensions/Windows',
-                '--method=org.gnome.Shell.Extensions.Windows.Activate',
-                str(window_id)
-            ], capture_output=True, text=True, timeout=5)
-
-            if activate_result.returncode == 0:
-                logger.info(f"Successfully focused terminal window {window_id}")
-                return True
-            else:
-                logger.error(f"Failed to activate window: {activate_result.stderr}")
+            try:
+                windows_iface.Activate(window_id)
+            except dbus.exceptions.DBusException as e:
+                logger.error(f"Failed to activate window: {e}")
                 return False
 
+            logger.info(f"Successfully focused terminal window {window_id}")
+            return True
+
         except Exception as e:
             logger.error(f"Error focusing terminal: {e}")
             return False
@@ -270,25 +273,19 @@ class ClaudeFocusService(dbus.service.Object):
     def send_error_notification(self, title: str, message: str):
         """Send an error notification to the user"""
         try:
-            bus = dbus.SessionBus()
-            notify_service = bus.get_object(
-                "org.freedesktop.Notifications",
-                "/org/freedesktop/Notifications"
-            )
-            notify_interface = dbus.Interface(
-                notify_service,
-                "org.freedesktop.Notifications"
-            )
-
-            notify_interface.Notify(
+            # Async call: we never use the returned notification id, so
+            # don't block the main loop waiting for the reply round-trip
+            self.notify_interface.Notify(
                 "Claude Focus",      # app name
                 0,                   # replaces id
                 "dialog-error",      # icon
                 title,               # summary
                 message,             # body
-                ["dismiss", "Dismiss"],  # actions
-                {"urgency": dbus.Byte(2)},  # hints
-                5000                 # timeout in ms
+                ERROR_ACTIONS,       # actions
+                ERROR_HINTS,         # hints
+                5000,                # timeout in ms
+                reply_handler=lambda notification_id: None,
+                error_handler=lambda e: logger.error(f"Failed to send error notification: {e}")
             )
         except Exception as e:
             logger.error(f"Failed to send error notification: {e}")
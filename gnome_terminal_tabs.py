@@ -41,10 +41,14 @@ API Reference:
 
 import dbus
 import os
-import re
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
+# GNOME_TERMINAL_SCREEN path layout - a fixed prefix followed by the UUID
+# with underscores instead of hyphens
+_SCREEN_PATH_PREFIX = '/org/gnome/Terminal/screen/'
+_UUID_CHARS = frozenset('0123456789abcdef_')
+
 
 @dataclass
 class TerminalTab:
@@ -312,11 +316,24 @@ def extract_uuid_from_screen_path(screen_path: str) -> Optional[str]:
         >>> uuid = extract_uuid_from_screen_path("/org/gnome/Terminal/screen/abc_def_123")
         >>> print(uuid)  # "abc-def-123"
     """
-    match = re.search(r'/org/gnome/Terminal/screen/([a-f0-9_]+)', screen_path)
-    if match:
-        # Convert underscores to hyphens for D-Bus format
-        return match.group(1).replace('_', '-')
-    return None
+    # The prefix is fixed, so a startswith + slice replaces the regex scan
+    if not screen_path.startswith(_SCREEN_PATH_PREFIX):
+        return None
+
+    uuid = screen_path[len(_SCREEN_PATH_PREFIX):]
+
+    # Keep only the leading run of valid UUID characters (matching the
+    # behaviour of the old [a-f0-9_]+ pattern)
+    for i, char in enumerate(uuid):
+        if char not in _UUID_CHARS:
+            uuid = uuid[:i]
+            break
+
+    if not uuid:
+        return None
+
+    # Convert underscores to hyphens for D-Bus format
+    return uuid.replace('_', '-')
 
 
 def focus_tab_by_directory(directory: str) -> bool:
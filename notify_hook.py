@@ -5,154 +5,289 @@ Sends desktop notifications when Claude needs user attention
 Automatically dismisses notifications when user responds or Claude starts working
 """
 
+import fcntl
 import json
 import sys
 import os
-import dbus
+import time
 import logging
-from datetime import datetime
+import logging.handlers
 from typing import Optional
 from pathlib import Path
 
+# Resolved once - used to re-invoke this script for the idle timer
+SCRIPT_PATH = Path(__file__).resolve()
+
 # File paths for tracking notifications
 CLAUDE_DIR = Path.home() / '.claude'
 ACTIVE_NOTIFICATIONS_FILE = CLAUDE_DIR / 'active-notifications.json'
+ACTIVE_NOTIFICATIONS_LOCK = CLAUDE_DIR / 'active-notifications.lock'
 IDLE_TIMER_FILE = CLAUDE_DIR / 'idle-timer.json'
 
 # Idle notification delay (seconds after Stop before sending idle notification)
 IDLE_NOTIFICATION_DELAY = 45
 
-# Logging setup (debug mode)
+# Cap on tracked sessions so active-notifications.json cannot grow without
+# bound when sessions exit uncleanly
+MAX_TRACKED_SESSIONS = 100
+
+# Events that mean the user responded or Claude is working again - all of
+# them dismiss any active notification for the session
+DISMISS_EVENTS = frozenset({'UserPromptSubmit', 'PreToolUse', 'PostToolUse', 'Stop'})
+
+# Subset of DISMISS_EVENTS that also cancels a pending idle notification
+IDLE_CANCEL_EVENTS = frozenset({'UserPromptSubmit', 'PreToolUse'})
+
+# Notification text constants - built (and encoded by the logging module)
+# once at import instead of on every event
+TITLE_WAITING = "⏳ Claude is Waiting"
+BODY_WAITING = "Claude has finished processing and is waiting for your response"
+TITLE_PERMISSION = "🔒 Permission Required"
+TITLE_GENERIC = "Claude Code"
+
+# Negative cache for the focus service: when a NameHasOwner check says the
+# service is not running, remember that on tmpfs for a while so subsequent
+# hook invocations skip the D-Bus round-trip entirely
+FOCUS_SERVICE_ABSENT_FILE = Path(f'/run/user/{os.getuid()}/claude-focus-absent')
+FOCUS_SERVICE_ABSENT_TTL = 60  # seconds
+
+# Notification action buttons are identical for every notification
+NOTIFY_ACTIONS = [
+    "focus_terminal", "Focus Terminal",
+    "dismiss", "Dismiss"
+]
+
+# Logging setup (debug mode). A rotating handler keeps the debug log from
+# growing without bound across thousands of hook invocations.
 logging.basicConfig(
-    filename='/tmp/claude-notify.log',
     level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.handlers.RotatingFileHandler(
+        '/tmp/claude-notify.log',
+        maxBytes=1024 * 1024,
+        backupCount=2
+    )]
 )
 logger = logging.getLogger(__name__)
 
+# Shared D-Bus connection and notification proxy, created on first use.
+# A hook invocation may talk to D-Bus several times (close old notification,
+# send new one, register with focus service) - reuse one connection for all.
+# dbus itself is imported lazily: many events (e.g. PreToolUse with nothing
+# to dismiss) never touch the bus, and importing dbus dominates cold start.
+_session_bus = None
+_notify_interface = None
+_notify_hints = None
+
+
+def get_session_bus() -> "dbus.SessionBus":
+    """Get the shared session bus connection, creating it on first use"""
+    global _session_bus
+    if _session_bus is None:
+        import dbus
+        _session_bus = dbus.SessionBus()
+    return _session_bus
+
+
+def get_notify_interface() -> "dbus.Interface":
+    """Get the shared org.freedesktop.Notifications interface"""
+    global _notify_interface
+    if _notify_interface is None:
+        import dbus
+        bus = get_session_bus()
+        # introspect=False skips the blocking Introspect round-trip; the
+        # methods we call are declared explicitly via dbus.Interface
+        notify_service = bus.get_object(
+            "org.freedesktop.Notifications",
+            "/org/freedesktop/Notifications",
+            introspect=False
+        )
+        _notify_interface = dbus.Interface(
+            notify_service,
+            "org.freedesktop.Notifications"
+        )
+    return _notify_interface
 
-def save_notification_id(session_id: str, notification_id: int):
-    """Save notification ID for a session to track active notifications"""
-    try:
-        # Load existing data
-        data = {}
-        if ACTIVE_NOTIFICATIONS_FILE.exists():
+
+def get_notify_hints() -> dict:
+    """Notification hints dict, built once on first use"""
+    global _notify_hints
+    if _notify_hints is None:
+        import dbus
+        # Critical urgency = persistent notification
+        _notify_hints = {"urgency": dbus.Byte(2)}
+    return _notify_hints
+
+
+# Singleton compact encoder for state files - json.dump builds an encoder
+# (and re-parses the separators) on every call, this one is reused
+_json_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
+# Per-invocation cache of active-notifications.json. Each hook invocation
+# is stateless across processes (state lives on disk), but within one
+# invocation the file may be consulted several times - load it once.
+_active_notifications = None
+
+
+def load_active_notifications() -> dict:
+    """Load the active-notifications state, cached for this invocation"""
+    global _active_notifications
+    if _active_notifications is None:
+        try:
             with open(ACTIVE_NOTIFICATIONS_FILE, 'r') as f:
-                data = json.load(f)
+                _active_notifications = json.load(f)
+        except FileNotFoundError:
+            _active_notifications = {}
+    return _active_notifications
 
-        # Update with new notification
-        data[session_id] = {
-            "notification_id": notification_id,
-            "timestamp": datetime.now().isoformat()
-        }
 
-        # Save back to file
-        with open(ACTIVE_NOTIFICATIONS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+def atomic_write(path: Path, content: str):
+    """Write content atomically via a same-directory temp file + rename
 
-        logger.info(f"Saved notification ID {notification_id} for session {session_id[:8]}...")
+    A reader (another hook process, or the idle timer) can never observe
+    a truncated or half-written file this way.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_active_notifications(data: dict):
+    """Write the active-notifications state back to disk"""
+    atomic_write(ACTIVE_NOTIFICATIONS_FILE, _json_encoder.encode(data))
+
+
+def save_notification_id(session_id: str, notification_id: int):
+    """Save notification ID for a session to track active notifications"""
+    global _active_notifications
+    try:
+        # Hooks for different sessions can run concurrently - serialize
+        # the read-modify-write via flock so updates are never lost
+        with open(ACTIVE_NOTIFICATIONS_LOCK, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            # Re-read under the lock in case another hook just wrote
+            _active_notifications = None
+            data = load_active_notifications()
+
+            # Update with new notification. Re-inserting moves the session to
+            # the end, so dict insertion order doubles as a ring buffer: once
+            # over the cap, the stalest entries are simply the first keys.
+            data.pop(session_id, None)
+            data[session_id] = {
+                "notification_id": notification_id,
+                "timestamp": int(time.time())
+            }
+            while len(data) > MAX_TRACKED_SESSIONS:
+                del data[next(iter(data))]
+
+            # Save back to file
+            write_active_notifications(data)
+
+        logger.info("Saved notification ID %s for session %.8s...", notification_id, session_id)
     except Exception as e:
-        logger.error(f"Failed to save notification ID: {e}")
+        logger.error("Failed to save notification ID: %s", e)
 
 
 def get_notification_id(session_id: str) -> Optional[int]:
     """Get the active notification ID for a session"""
     try:
-        if not ACTIVE_NOTIFICATIONS_FILE.exists():
-            return None
-
-        with open(ACTIVE_NOTIFICATIONS_FILE, 'r') as f:
-            data = json.load(f)
+        data = load_active_notifications()
 
         session_data = data.get(session_id)
         if session_data:
             return session_data.get("notification_id")
         return None
     except Exception as e:
-        logger.error(f"Failed to get notification ID: {e}")
+        logger.error("Failed to get notification ID: %s", e)
         return None
 
 
 def remove_notification_id(session_id: str):
     """Remove notification ID from tracking after dismissal"""
+    global _active_notifications
     try:
-        if not ACTIVE_NOTIFICATIONS_FILE.exists():
-            return
+        with open(ACTIVE_NOTIFICATIONS_LOCK, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
 
-        with open(ACTIVE_NOTIFICATIONS_FILE, 'r') as f:
-            data = json.load(f)
+            # Re-read under the lock in case another hook just wrote
+            _active_notifications = None
+            data = load_active_notifications()
 
-        if session_id in data:
-            del data[session_id]
+            if session_id in data:
+                del data[session_id]
 
-            with open(ACTIVE_NOTIFICATIONS_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+                write_active_notifications(data)
 
-            logger.info(f"Removed notification tracking for session {session_id[:8]}...")
+                logger.info("Removed notification tracking for session %.8s...", session_id)
     except Exception as e:
-        logger.error(f"Failed to remove notification ID: {e}")
+        logger.error("Failed to remove notification ID: %s", e)
 
 
 def save_idle_timer(session_id: str, cwd: str):
     """Save idle timer info to trigger delayed notification"""
     try:
+        now = time.time()
         data = {
             "session_id": session_id,
             "cwd": cwd,
-            "timestamp": datetime.now().isoformat(),
-            "trigger_time": (datetime.now().timestamp() + IDLE_NOTIFICATION_DELAY)
+            "timestamp": int(now),
+            "trigger_time": now + IDLE_NOTIFICATION_DELAY
         }
-        with open(IDLE_TIMER_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-        logger.info(f"Saved idle timer for session {session_id[:8]}... (will trigger in {IDLE_NOTIFICATION_DELAY}s)")
+        atomic_write(IDLE_TIMER_FILE, _json_encoder.encode(data))
+        logger.info("Saved idle timer for session %.8s... (will trigger in %ds)", session_id, IDLE_NOTIFICATION_DELAY)
     except Exception as e:
-        logger.error(f"Failed to save idle timer: {e}")
+        logger.error("Failed to save idle timer: %s", e)
 
 
 def clear_idle_timer():
     """Clear idle timer (cancel pending notification)"""
     try:
-        if IDLE_TIMER_FILE.exists():
-            IDLE_TIMER_FILE.unlink()
-            logger.debug("Cleared idle timer")
+        IDLE_TIMER_FILE.unlink(missing_ok=True)
+        logger.debug("Cleared idle timer")
     except Exception as e:
-        logger.error(f"Failed to clear idle timer: {e}")
+        logger.error("Failed to clear idle timer: %s", e)
 
 
 def spawn_idle_notification_timer():
     """Spawn background process to send idle notification after delay"""
     try:
-        import subprocess
-        script_path = Path(__file__).resolve()
-        # Spawn detached background process
-        subprocess.Popen(
-            [sys.executable, str(script_path), '--idle-timer'],
-            start_new_session=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
+        # Spawn detached background process. os.posix_spawn avoids the
+        # fork+exec and Popen machinery of subprocess: setsid=True detaches
+        # the child and file_actions routes its stdio to /dev/null.
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ]
+        os.posix_spawn(
+            sys.executable,
+            [sys.executable, str(SCRIPT_PATH), '--idle-timer'],
+            os.environ,
+            file_actions=file_actions,
+            setsid=True
         )
         logger.info("Spawned idle notification timer process")
     except Exception as e:
-        logger.error(f"Failed to spawn idle timer: {e}")
+        logger.error("Failed to spawn idle timer: %s", e)
 
 
 def run_idle_timer():
     """Background process: wait and send idle notification if still needed"""
-    import time
-
-    logger.info(f"Idle timer started, waiting {IDLE_NOTIFICATION_DELAY} seconds...")
+    logger.info("Idle timer started, waiting %d seconds...", IDLE_NOTIFICATION_DELAY)
     time.sleep(IDLE_NOTIFICATION_DELAY)
 
     try:
-        # Check if timer file still exists
-        if not IDLE_TIMER_FILE.exists():
+        # Load timer data (a missing file means the timer was cancelled)
+        try:
+            with open(IDLE_TIMER_FILE, 'r') as f:
+                timer_data = json.load(f)
+        except FileNotFoundError:
             logger.info("Idle timer cancelled (file removed)")
             return
 
-        # Load timer data
-        with open(IDLE_TIMER_FILE, 'r') as f:
-            timer_data = json.load(f)
-
         session_id = timer_data.get('session_id')
         cwd = timer_data.get('cwd', '')
 
@@ -163,23 +298,16 @@ def run_idle_timer():
             return
 
         # Send idle notification
-        logger.info(f"Idle timer triggered for session {session_id[:8] if session_id else 'unknown'}...")
-
-        title = "⏳ Claude is Waiting"
-        body = "Claude has finished processing and is waiting for your response"
+        logger.info("Idle timer triggered for session %.8s...", session_id or "unknown")
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        if cwd:
-            dir_name = os.path.basename(cwd) or cwd
-            body = f"{body}\n📁 {dir_name} • {timestamp}"
-        else:
-            body = f"{body}\n[{timestamp}]"
+        title = TITLE_WAITING
+        body = add_body_context(BODY_WAITING, cwd)
 
         notification_id = send_notification_with_actions(title, body, session_id)
 
         if notification_id:
             save_notification_id(session_id, notification_id)
-            logger.info(f"Idle notification sent successfully (ID: {notification_id})")
+            logger.info("Idle notification sent successfully (ID: %s)", notification_id)
         else:
             logger.error("Failed to send idle notification")
 
@@ -187,54 +315,39 @@ def run_idle_timer():
         clear_idle_timer()
 
     except Exception as e:
-        logger.error(f"Idle timer error: {e}")
+        logger.error("Idle timer error: %s", e)
         import traceback
         logger.debug(traceback.format_exc())
 
 
+def add_body_context(body: str, cwd: str) -> str:
+    """Append directory and timestamp context to a notification body"""
+    timestamp = time.strftime("%H:%M:%S")
+    if cwd:
+        dir_name = os.path.basename(cwd) or cwd
+        return f"{body}\n📁 {dir_name} • {timestamp}"
+    return f"{body}\n[{timestamp}]"
+
+
 def close_notification(notification_id: int) -> bool:
     """Close a notification using D-Bus"""
     try:
-        bus = dbus.SessionBus()
-        notify_service = bus.get_object(
-            "org.freedesktop.Notifications",
-            "/org/freedesktop/Notifications"
-        )
-        notify_interface = dbus.Interface(
-            notify_service,
-            "org.freedesktop.Notifications"
-        )
+        import dbus
+        notify_interface = get_notify_interface()
 
         # Call CloseNotification method
         notify_interface.CloseNotification(dbus.UInt32(notification_id))
-        logger.info(f"Successfully closed notification {notification_id}")
+        logger.info("Successfully closed notification %s", notification_id)
         return True
     except Exception as e:
-        logger.error(f"Failed to close notification {notification_id}: {e}")
+        logger.error("Failed to close notification %s: %s", notification_id, e)
         return False
 
 
 def send_notification_with_actions(title: str, message: str, session_id: str) -> Optional[int]:
     """Send desktop notification with clickable actions"""
     try:
-        bus = dbus.SessionBus()
-        notify_service = bus.get_object(
-            "org.freedesktop.Notifications",
-            "/org/freedesktop/Notifications"
-        )
-        notify_interface = dbus.Interface(
-            notify_service,
-            "org.freedesktop.Notifications"
-        )
-
-        # Notification with action buttons
-        actions = [
-            "focus_terminal", "Focus Terminal",
-            "dismiss", "Dismiss"
-        ]
-
-        # Critical urgency = persistent notification
-        hints = {"urgency": dbus.Byte(2)}
+        notify_interface = get_notify_interface()
 
         notification_id = notify_interface.Notify(
             "Claude Code",           # app name
@@ -242,25 +355,54 @@ def send_notification_with_actions(title: str, message: str, session_id: str) ->
             "dialog-information",   # icon
             title,                  # summary
             message,                # body
-            actions,                # actions
-            hints,                  # hints
-            0                       # timeout (0 = persistent)
+            NOTIFY_ACTIONS,         # actions
+            get_notify_hints(),     # hints
+            0,                      # timeout (0 = persistent)
+            # Explicit signature since we skip introspection
+            signature="susssasa{sv}i"
         )
 
-        logger.info(f"Notification sent successfully (ID: {notification_id})")
+        logger.info("Notification sent successfully (ID: %s)", notification_id)
         return notification_id
 
     except Exception as e:
-        logger.error(f"Failed to send notification: {e}")
+        logger.error("Failed to send notification: %s", e)
         return None
 
 
+def environ_lookup(env_data: bytes, key: bytes) -> Optional[str]:
+    """Look up a single variable in raw /proc/<pid>/environ data
+
+    Probes for the key directly instead of decoding and splitting the whole
+    environment into a dict - we only ever need one or two variables.
+    """
+    token = key + b'='
+    if env_data.startswith(token):
+        start = len(token)
+    else:
+        idx = env_data.find(b'\0' + token)
+        if idx == -1:
+            return None
+        start = idx + 1 + len(token)
+    end = env_data.find(b'\0', start)
+    if end == -1:
+        end = len(env_data)
+    return env_data[start:end].decode('utf-8', errors='ignore')
+
+
 def get_terminal_screen_uuid() -> Optional[str]:
     """Get GNOME_TERMINAL_SCREEN UUID from the bash parent process"""
     try:
-        # Walk up process tree: notify_hook -> claude -> bash
-        current_pid = os.getpid()
+        # Fast path: the hook inherits bash's environment through claude,
+        # so the variable is usually already in our own environ and no
+        # /proc walk is needed at all
+        screen_uuid = os.environ.get('GNOME_TERMINAL_SCREEN')
+        if screen_uuid:
+            logger.info("Found terminal screen UUID in own environment: %s", screen_uuid)
+            return screen_uuid
 
+        # Fallback: walk up process tree: notify_hook -> claude -> bash
+        # (covers hooks spawned with a scrubbed environment)
         # Get Claude process (our parent)
         claude_pid = os.getppid()
 
@@ -272,45 +414,61 @@ def get_terminal_screen_uuid() -> Optional[str]:
         # Read bash environment for GNOME_TERMINAL_SCREEN
         env_file = f'/proc/{bash_pid}/environ'
         with open(env_file, 'rb') as f:
-            env_data = f.read().decode('utf-8', errors='ignore')
+            env_data = f.read()
 
-        # Parse environment variables
-        env_vars = {}
-        for line in env_data.split('\0'):
-            if '=' in line:
-                key, value = line.split('=', 1)
-                env_vars[key] = value
-
-        screen_uuid = env_vars.get('GNOME_TERMINAL_SCREEN')
-        service_id = env_vars.get('GNOME_TERMINAL_SERVICE')
+        screen_uuid = environ_lookup(env_data, b'GNOME_TERMINAL_SCREEN')
+        service_id = environ_lookup(env_data, b'GNOME_TERMINAL_SERVICE')
 
         if screen_uuid:
-            logger.info(f"Found terminal screen UUID: {screen_uuid}")
+            logger.info("Found terminal screen UUID: %s", screen_uuid)
             if service_id:
-                logger.info(f"Found terminal service ID: {service_id}")
+                logger.info("Found terminal service ID: %s", service_id)
             return screen_uuid
         else:
             logger.warning("No GNOME_TERMINAL_SCREEN found in bash environment")
             return None
 
     except Exception as e:
-        logger.error(f"Failed to get terminal screen UUID: {e}")
+        logger.error("Failed to get terminal screen UUID: %s", e)
         return None
 
 
+def focus_service_available(bus) -> bool:
+    """Check whether the focus service is running, caching a negative result
+
+    A fresh negative-cache file on tmpfs means a recent check already found
+    the service absent, so skip the NameHasOwner round-trip.
+    """
+    try:
+        if time.time() - FOCUS_SERVICE_ABSENT_FILE.stat().st_mtime < FOCUS_SERVICE_ABSENT_TTL:
+            return False
+    except OSError:
+        pass
+
+    present = bool(bus.name_has_owner("com.claude.FocusService"))
+    if not present:
+        try:
+            FOCUS_SERVICE_ABSENT_FILE.touch()
+        except OSError as e:
+            logger.debug("Could not write focus-service cache file: %s", e)
+    return present
+
+
 def register_session_with_service(session_id: str, cwd: str, terminal_screen: Optional[str], notification_id: int):
     """Register session with the Focus Service"""
     try:
-        bus = dbus.SessionBus()
+        import dbus
+        bus = get_session_bus()
 
         # Check if service is running
-        if not bus.name_has_owner("com.claude.FocusService"):
+        if not focus_service_available(bus):
             logger.warning("Focus service not running")
             return
 
         service = bus.get_object(
             "com.claude.FocusService",
-            "/com/claude/FocusService"
+            "/com/claude/FocusService",
+            introspect=False
         )
         focus_interface = dbus.Interface(
             service,
@@ -320,18 +478,18 @@ def register_session_with_service(session_id: str, cwd: str, terminal_screen: Op
         # Register session with terminal screen UUID
         success = focus_interface.RegisterSession(session_id, cwd, terminal_screen or "")
         if success:
-            logger.info(f"Registered session {session_id[:8]}... with terminal screen {terminal_screen}")
+            logger.info("Registered session %.8s... with terminal screen %s", session_id, terminal_screen)
 
             # Map notification to session
             focus_interface.MapNotification(str(notification_id), session_id)
-            logger.info(f"Mapped notification {notification_id} to session {session_id[:8]}...")
+            logger.info("Mapped notification %s to session %.8s...", notification_id, session_id)
         else:
-            logger.warning(f"Failed to register session {session_id[:8]}...")
+            logger.warning("Failed to register session %.8s...", session_id)
 
     except dbus.exceptions.DBusException as e:
-        logger.debug(f"Focus service not available: {e}")
+        logger.debug("Focus service not available: %s", e)
     except Exception as e:
-        logger.error(f"Error registering session: {e}")
+        logger.error("Error registering session: %s", e)
 
 
 def main():
@@ -342,7 +500,7 @@ def main():
     try:
         # Read JSON input from stdin
         input_data = json.load(sys.stdin)
-        logger.debug(f"Received: {json.dumps(input_data, indent=2)}")
+        logger.debug("Received: %s", json.dumps(input_data, indent=2))
 
         # Extract event data
         event_type = input_data.get('hook_event_name', '')
@@ -353,77 +511,34 @@ def main():
         # Get terminal screen UUID for precise terminal identification
         terminal_screen = get_terminal_screen_uuid()
 
-        logger.info(f"Event: {event_type}")
-        logger.info(f"Session: {session_id}")
-        logger.info(f"CWD: {cwd}")
-        logger.info(f"Terminal screen: {terminal_screen}")
+        logger.info("Event: %s", event_type)
+        logger.info("Session: %s", session_id)
+        logger.info("CWD: %s", cwd)
+        logger.info("Terminal screen: %s", terminal_screen)
 
-        # Handle UserPromptSubmit - user started typing, dismiss any active notification
-        if event_type == 'UserPromptSubmit':
-            logger.info("UserPromptSubmit - user is responding, dismissing notification")
+        # UserPromptSubmit / PreToolUse / PostToolUse / Stop all mean the
+        # user responded or Claude is working - dismiss any active notification
+        if event_type in DISMISS_EVENTS:
+            logger.info("%s - dismissing any active notification", event_type)
 
             # Cancel any pending idle notification
-            clear_idle_timer()
+            if event_type in IDLE_CANCEL_EVENTS:
+                clear_idle_timer()
 
             notification_id = get_notification_id(session_id)
             if notification_id:
                 if close_notification(notification_id):
                     remove_notification_id(session_id)
-                    logger.info(f"Dismissed notification {notification_id} for session {session_id[:8]}...")
+                    logger.info("Dismissed notification %s for session %.8s...", notification_id, session_id)
                 else:
-                    logger.warning(f"Failed to dismiss notification {notification_id}")
+                    logger.warning("Failed to dismiss notification %s", notification_id)
             else:
                 logger.debug("No active notification to dismiss")
-            return 0
-
-        # Handle PreToolUse - Claude started working, dismiss any active notification
-        if event_type == 'PreToolUse':
-            logger.info("PreToolUse - Claude is working, dismissing notification")
 
-            # Cancel any pending idle notification
-            clear_idle_timer()
-
-            notification_id = get_notification_id(session_id)
-            if notification_id:
-                if close_notification(notification_id):
-                    remove_notification_id(session_id)
-                    logger.info(f"Dismissed notification {notification_id} for session {session_id[:8]}...")
-                else:
-                    logger.warning(f"Failed to dismiss notification {notification_id}")
-            else:
-                logger.debug("No active notification to dismiss")
-            return 0
-
-        # Handle PostToolUse - Claude finished a tool, dismiss any active notification
-        if event_type == 'PostToolUse':
-            logger.info("PostToolUse - Claude finished tool execution, dismissing notification")
-            notification_id = get_notification_id(session_id)
-            if notification_id:
-                if close_notification(notification_id):
-                    remove_notification_id(session_id)
-                    logger.info(f"Dismissed notification {notification_id} for session {session_id[:8]}...")
-                else:
-                    logger.warning(f"Failed to dismiss notification {notification_id}")
-            else:
-                logger.debug("No active notification to dismiss")
-            return 0
-
-        # Handle Stop - Claude finished responding, dismiss any active notification
-        if event_type == 'Stop':
-            logger.info("Stop - Claude finished responding, dismissing notification")
-            notification_id = get_notification_id(session_id)
-            if notification_id:
-                if close_notification(notification_id):
-                    remove_notification_id(session_id)
-                    logger.info(f"Dismissed notification {notification_id} for session {session_id[:8]}...")
-                else:
-                    logger.warning(f"Failed to dismiss notification {notification_id}")
-            else:
-                logger.debug("No active notification to dismiss")
-
-            # Start idle timer to send notification if user doesn't respond
-            save_idle_timer(session_id, cwd)
-            spawn_idle_notification_timer()
+            if event_type == 'Stop':
+                # Start idle timer to send notification if user doesn't respond
+                save_idle_timer(session_id, cwd)
+                spawn_idle_notification_timer()
 
             return 0
 
@@ -434,30 +549,25 @@ def main():
         message_lower = message.lower()
 
         if "waiting for your input" in message_lower or "idle" in message_lower:
-            title = "⏳ Claude is Waiting"
-            body = "Claude has finished processing and is waiting for your response"
+            title = TITLE_WAITING
+            body = BODY_WAITING
         elif "permission" in message_lower:
-            title = "🔒 Permission Required"
+            title = TITLE_PERMISSION
             body = message
         else:
             # Generic notification
-            title = "Claude Code"
+            title = TITLE_GENERIC
             body = message
 
         # Add context to notification
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        if cwd:
-            dir_name = os.path.basename(cwd) or cwd
-            body = f"{body}\n📁 {dir_name} • {timestamp}"
-        else:
-            body = f"{body}\n[{timestamp}]"
+        body = add_body_context(body, cwd)
 
         # Send notification with actions
         if session_id != 'unknown':
             # Close any existing notification for this session before sending a new one
             old_notification_id = get_notification_id(session_id)
             if old_notification_id:
-                logger.info(f"Closing previous notification {old_notification_id} before sending new one")
+                logger.info("Closing previous notification %s before sending new one", old_notification_id)
                 close_notification(old_notification_id)
 
             notification_id = send_notification_with_actions(title, body, session_id)
@@ -475,9 +585,9 @@ def main():
             logger.warning("No session ID provided, skipping notification")
 
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON input: {e}")
+        logger.error("Failed to parse JSON input: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         import traceback
         logger.debug(traceback.format_exc())
 
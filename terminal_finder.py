@@ -7,7 +7,9 @@ This can be used for testing and debugging the terminal discovery system.
 """
 
 import os
+import re
 import sys
+import shutil
 import subprocess
 import logging
 from typing import List, Optional, Dict, Tuple
@@ -19,34 +21,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once - case-insensitive search avoids allocating a lowered copy
+# of every command line just to look for one word
+CLAUDE_PATTERN = re.compile('claude', re.IGNORECASE)
+
+# Session type cannot change while the process runs - detect it once
+_session_type = None
+
+# Resolved once at import - cheaper than spawning wmctrl just to learn it
+# is missing, and the PATH will not change under us
+WMCTRL = shutil.which('wmctrl')
+
 class TerminalDiscovery:
     """Advanced terminal discovery with multiple methods"""
 
     @staticmethod
     def get_all_processes() -> List[Dict]:
-        """Get detailed process information"""
+        """Get detailed process information straight from /proc"""
         processes = []
         try:
-            # Use ps to get detailed process info
-            result = subprocess.run([
-                'ps', 'axo', 'pid,ppid,comm,args,cwd'
-            ], capture_output=True, text=True)
+            # Walk /proc directly instead of forking ps and parsing its
+            # column output - one read of stat and cmdline per process
+            for entry in os.scandir('/proc'):
+                if not entry.name.isdigit():
+                    continue
 
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                for line in lines:
-                    parts = line.strip().split(None, 4)
-                    if len(parts) >= 4:
-                        try:
-                            processes.append({
-                                'pid': int(parts[0]),
-                                'ppid': int(parts[1]),
-                                'comm': parts[2],
-                                'args': parts[3] if len(parts) > 3 else '',
-                                'cwd': parts[4] if len(parts) > 4 else ''
-                            })
-                        except ValueError:
-                            continue
+                try:
+                    pid = int(entry.name)
+                    with open(f"/proc/{pid}/stat", 'r') as f:
+                        stat_data = f.read()
+
+                    # comm is parenthesized and may itself contain spaces
+                    # or parens, so parse around the last ')'
+                    rparen = stat_data.rfind(')')
+                    comm = stat_data[stat_data.find('(') + 1:rparen]
+                    ppid = int(stat_data[rparen + 2:].split(None, 2)[1])
+
+                    with open(f"/proc/{pid}/cmdline", 'r') as f:
+                        args = f.read().replace('\0', ' ').strip()
+
+                    processes.append({
+                        'pid': pid,
+                        'ppid': ppid,
+                        'comm': comm,
+                        'args': args
+                    })
+                except (OSError, ValueError, IndexError):
+                    continue
 
         except Exception as e:
             logger.error(f"Failed to get process list: {e}")
@@ -61,8 +82,8 @@ class TerminalDiscovery:
 
         for proc in processes:
             # Look for claude in command or args
-            if ('claude' in proc['comm'].lower() or
-                'claude' in proc['args'].lower()):
+            if (CLAUDE_PATTERN.search(proc['comm']) or
+                CLAUDE_PATTERN.search(proc['args'])):
                 claude_processes.append(proc)
 
         return claude_processes
@@ -76,36 +97,38 @@ class TerminalDiscovery:
             # Get absolute path
             target_dir = os.path.abspath(target_dir)
 
-            # Look through /proc for processes with matching CWD
-            for pid_dir in os.listdir('/proc'):
-                if not pid_dir.isdigit():
+            # Look through /proc for processes with matching CWD.
+            # scandir streams entries instead of materializing the whole
+            # directory listing the way os.listdir does.
+            for entry in os.scandir('/proc'):
+                if not entry.name.isdigit():
                     continue
 
                 try:
-                    pid = int(pid_dir)
-                    cwd_link = f"/proc/{pid}/cwd"
-
-                    if os.path.exists(cwd_link):
-                        actual_cwd = os.readlink(cwd_link)
-                        if actual_cwd == target_dir:
-                            # Get process info
-                            with open(f"/proc/{pid}/comm", 'r') as f:
-                                comm = f.read().strip()
-
-                            with open(f"/proc/{pid}/cmdline", 'r') as f:
-                                cmdline = f.read().replace('\0', ' ').strip()
-
-                            with open(f"/proc/{pid}/stat", 'r') as f:
-                                stat_data = f.read().split()
-                                ppid = int(stat_data[3]) if len(stat_data) > 3 else 0
-
-                            matching_processes.append({
-                                'pid': pid,
-                                'ppid': ppid,
-                                'comm': comm,
-                                'cmdline': cmdline,
-                                'cwd': actual_cwd
-                            })
+                    pid = int(entry.name)
+                    # readlink directly - a vanished or inaccessible process
+                    # raises OSError, which the except below handles, so the
+                    # extra exists() stat per PID is pure overhead
+                    actual_cwd = os.readlink(f"/proc/{pid}/cwd")
+                    if actual_cwd == target_dir:
+                        # Get process info
+                        with open(f"/proc/{pid}/comm", 'r') as f:
+                            comm = f.read().strip()
+
+                        with open(f"/proc/{pid}/cmdline", 'r') as f:
+                            cmdline = f.read().replace('\0', ' ').strip()
+
+                        with open(f"/proc/{pid}/stat", 'r') as f:
+                            stat_data = f.read().split()
+                            ppid = int(stat_data[3]) if len(stat_data) > 3 else 0
+
+                        matching_processes.append({
+                            'pid': pid,
+                            'ppid': ppid,
+                            'comm': comm,
+                            'cmdline': cmdline,
+                            'cwd': actual_cwd
+                        })
 
                 except (OSError, ValueError, IndexError):
                     continue
@@ -137,13 +160,14 @@ class TerminalDiscovery:
 
         for depth in range(max_depth):
             try:
-                # Get process info
-                with open(f"/proc/{current_pid}/comm", 'r') as f:
-                    comm = f.read().strip()
-
+                # One stat read per level gives both comm (parenthesized)
+                # and ppid - no separate /proc/<pid>/comm open needed
                 with open(f"/proc/{current_pid}/stat", 'r') as f:
-                    stat_data = f.read().split()
-                    ppid = int(stat_data[3]) if len(stat_data) > 3 else 0
+                    stat_data = f.read()
+
+                rparen = stat_data.rfind(')')
+                comm = stat_data[stat_data.find('(') + 1:rparen]
+                ppid = int(stat_data[rparen + 2:].split(None, 2)[1])
 
                 path.append((current_pid, comm))
 
@@ -162,17 +186,25 @@ class TerminalDiscovery:
         """Find all terminal windows using wmctrl"""
         windows = []
 
+        if WMCTRL is None:
+            logger.warning("wmctrl not available")
+            return windows
+
         try:
-            result = subprocess.run(['wmctrl', '-lp'], capture_output=True, text=True)
+            result = subprocess.run([WMCTRL, '-lp'], capture_output=True, text=True)
 
             if result.returncode == 0:
                 for line in result.stdout.strip().split('\n'):
-                    parts = line.split()
+                    # wmctrl -lp columns: id desktop pid host title...
+                    # One bounded split yields every field, including the
+                    # title with its internal whitespace intact, instead
+                    # of splitting fully and re-joining the tail
+                    parts = line.split(None, 4)
                     if len(parts) >= 4:
                         window_id = parts[0]
                         desktop = parts[1]
                         window_pid = parts[2]
-                        window_title = ' '.join(parts[4:]) if len(parts) > 4 else ''
+                        window_title = parts[4] if len(parts) > 4 else ''
 
                         try:
                             # Get process info for this window
@@ -255,37 +287,29 @@ class TerminalDiscovery:
         except Exception as e:
             logger.warning(f"Claude session correlation failed: {e}")
 
-        # Fallback to basic Window Calls method
+        # Fallback to basic Window Calls method, called in-process over
+        # D-Bus instead of forking gdbus twice and parsing its text output
         try:
-            result = subprocess.run([
-                'gdbus', 'call', '--session',
-                '--dest=org.gnome.Shell',
-                '--object-path=/org/gnome/Shell/Extensions/Windows',
-                '--method=org.gnome.Shell.Extensions.Windows.List'
-            ], capture_output=True, text=True, timeout=5)
-
-            if result.returncode == 0:
-                import json
-                windows_data = result.stdout.strip()
-                if windows_data.startswith("('[") and windows_data.endswith("',)"):
-                    json_str = windows_data[2:-3]
-                    windows = json.loads(json_str)
-
-                    terminal_windows = [w for w in windows if w.get('wm_class') == 'gnome-terminal-server']
-
-                    if terminal_windows:
-                        window_id = terminal_windows[0]['id']
-                        activate_result = subprocess.run([
-                            'gdbus', 'call', '--session',
-                            '--dest=org.gnome.Shell',
-                            '--object-path=/org/gnome/Shell/Extensions/Windows',
-                            '--method=org.gnome.Shell.Extensions.Windows.Activate',
-                            str(window_id)
-                        ], capture_output=True, text=True, timeout=5)
-
-                        if activate_result.returncode == 0:
-                            logger.info(f"Successfully focused terminal using fallback method (ID: {window_id})")
-                            return True
+            import dbus
+            import json
+
+            bus = dbus.SessionBus()
+            shell = bus.get_object(
+                'org.gnome.Shell',
+                '/org/gnome/Shell/Extensions/Windows'
+            )
+            windows_iface = dbus.Interface(
+                shell, 'org.gnome.Shell.Extensions.Windows'
+            )
+
+            windows = json.loads(str(windows_iface.List()))
+            terminal_windows = [w for w in windows if w.get('wm_class') == 'gnome-terminal-server']
+
+            if terminal_windows:
+                window_id = terminal_windows[0]['id']
+                windows_iface.Activate(window_id)
+                logger.info(f"Successfully focused terminal using fallback method (ID: {window_id})")
+                return True
         except Exception as e:
             logger.debug(f"Fallback method failed: {e}")
 
@@ -294,9 +318,11 @@ class TerminalDiscovery:
 
     @staticmethod
     def detect_session_type() -> str:
-        """Detect if running on X11 or Wayland"""
-        session_type = os.environ.get('XDG_SESSION_TYPE', 'unknown')
-        return session_type
+        """Detect if running on X11 or Wayland (memoized)"""
+        global _session_type
+        if _session_type is None:
+            _session_type = os.environ.get('XDG_SESSION_TYPE', 'unknown')
+        return _session_type
 
 def analyze_current_session():
     """Analyze the current terminal session"""
@@ -394,18 +420,18 @@ def test_focus_current_terminal():
     print(f"Found target window: {target_window['window_id']}")
 
     # Test focusing with wmctrl
-    try:
-        result = subprocess.run([
-            'wmctrl', '-ia', target_window['window_id']
-        ], capture_output=True, text=True)
+    if WMCTRL is None:
+        print("wmctrl not available")
+        return
 
-        if result.returncode == 0:
-            print("Successfully focused window with wmctrl")
-        else:
-            print(f"Failed to focus with wmctrl: {result.stderr}")
+    result = subprocess.run([
+        WMCTRL, '-ia', target_window['window_id']
+    ], capture_output=True, text=True)
 
-    except FileNotFoundError:
-        print("wmctrl not available")
+    if result.returncode == 0:
+        print("Successfully focused window with wmctrl")
+    else:
+        print(f"Failed to focus with wmctrl: {result.stderr}")
 
 def main():
     """Main entry point"""
@@ -5,23 +5,37 @@ Test script for D-Bus tab switching in GNOME Terminal
 import dbus
 import sys
 import os
-import re
+
+SCREEN_PATH_PREFIX = '/org/gnome/Terminal/screen/'
+
+# Cached SearchProvider interface - connecting to the bus and fetching the
+# proxy is the expensive part, and every helper here needs the same one
+_search_provider = None
+
+def get_search_provider():
+    """Get the GNOME Terminal SearchProvider interface (cached)"""
+    global _search_provider
+    if _search_provider is None:
+        bus = dbus.SessionBus()
+        terminal = bus.get_object('org.gnome.Terminal', '/org/gnome/Terminal/SearchProvider')
+        _search_provider = dbus.Interface(terminal, 'org.gnome.Shell.SearchProvider2')
+    return _search_provider
 
 def extract_uuid_from_screen_path(screen_path):
     """Extract UUID from GNOME_TERMINAL_SCREEN path"""
     # Format: /org/gnome/Terminal/screen/UUID_WITH_UNDERSCORES
-    match = re.search(r'/org/gnome/Terminal/screen/([a-f0-9_]+)', screen_path)
-    if match:
-        # Convert underscores to hyphens for D-Bus format
-        return match.group(1).replace('_', '-')
+    # The prefix is fixed, so slice it off instead of running a regex
+    if screen_path.startswith(SCREEN_PATH_PREFIX):
+        uuid = screen_path[len(SCREEN_PATH_PREFIX):]
+        if uuid:
+            # Convert underscores to hyphens for D-Bus format
+            return uuid.replace('_', '-')
     return None
 
 def get_all_terminal_tabs():
     """Get all terminal tabs via D-Bus SearchProvider"""
     try:
-        bus = dbus.SessionBus()
-        terminal = bus.get_object('org.gnome.Terminal', '/org/gnome/Terminal/SearchProvider')
-        search_provider = dbus.Interface(terminal, 'org.gnome.Shell.SearchProvider2')
+        search_provider = get_search_provider()
 
         # Get all tabs
         tab_ids = search_provider.GetInitialResultSet([])
@@ -38,9 +52,7 @@ def get_all_terminal_tabs():
 def focus_terminal_tab_by_uuid(uuid):
     """Focus a specific terminal tab by UUID"""
     try:
-        bus = dbus.SessionBus()
-        terminal = bus.get_object('org.gnome.Terminal', '/org/gnome/Terminal/SearchProvider')
-        search_provider = dbus.Interface(terminal, 'org.gnome.Shell.SearchProvider2')
+        search_provider = get_search_provider()
 
         # Activate the tab
         search_provider.ActivateResult(uuid, [], 0)
@@ -51,14 +63,27 @@ def focus_terminal_tab_by_uuid(uuid):
 
 def find_tab_by_working_directory(cwd):
     """Find a tab by its working directory in the title"""
-    tabs = get_all_terminal_tabs()
+    basename = os.path.basename(cwd)
+    try:
+        search_provider = get_search_provider()
+
+        # Let GNOME Terminal filter server-side: passing the directory as
+        # a search term returns only matching tab UUIDs, so metadata is
+        # fetched for a few candidates instead of every open tab
+        tab_ids = search_provider.GetInitialResultSet([basename or cwd])
+        if not tab_ids:
+            return None, None
+
+        metas = search_provider.GetResultMetas(tab_ids)
+    except Exception as e:
+        print(f"Error getting terminal tabs: {e}")
+        return None, None
 
-    for tab_id, meta in tabs:
+    for tab_id, meta in zip(tab_ids, metas):
         name = meta.get('name', '')
-        description = meta.get('description', '')
 
         # Check if the directory appears in the tab name
-        if cwd in name or os.path.basename(cwd) in name:
+        if cwd in name or basename in name:
             return tab_id, meta
 
     return None, None